@@ -92,11 +92,15 @@ def orthogonalize_gs(
     N = N % x.ndim
     if N in axis:
         raise ValueError("Cannot orthogonalize a single vector.")
+    if x.shape[N] == 1:
+        # A single vector is already orthogonal
+        return x
     # Move axis N to the front for convenience
-    x = np.moveaxis(x, N, 0)
-    u = x.copy()
-    for i in range(1, len(x)):
-        u[i:] -= projection(x[i:], u[i - 1:i], axis=axis)
+    u = np.moveaxis(x, N, 0).copy()
+    # Modified Gram-Schmidt: at each step, all of the remaining vectors are
+    # projected away from the newest basis vector at once.
+    for i in range(1, len(u)):
+        u[i:] -= projection(u[i:], u[i - 1:i], axis=axis)
     return np.moveaxis(u, 0, N)
 
 
@@ -64,41 +64,48 @@ class Convolution(Operator):
         assert psi.shape[:-2] == scan.shape[:-2], (psi.shape, scan.shape)
         assert probe.shape[:-4] == scan.shape[:-2], (probe.shape, scan.shape)
         assert probe.shape[-4] == 1 or probe.shape[-4] == scan.shape[-2]
-        if self.detector_shape == self.probe_shape:
-            patches = self.xp.empty_like(
-                psi,
-                shape=(
-                    *scan.shape[:-2],
-                    scan.shape[-2] * probe.shape[-3],
-                    self.detector_shape,
-                    self.detector_shape,
-                ),
-            )
-        else:
-            patches = self.xp.zeros_like(
+        # Extract each patch once and broadcast it over the probe modes
+        # instead of extracting a separate copy of the patch for every mode.
+        # The patches are unpadded, so patch.fwd() writes every element.
+        patches = self.patch.fwd(
+            patches=self.xp.empty_like(
                 psi,
                 shape=(
                     *scan.shape[:-2],
-                    scan.shape[-2] * probe.shape[-3],
-                    self.detector_shape,
-                    self.detector_shape,
+                    scan.shape[-2],
+                    self.probe_shape,
+                    self.probe_shape,
                 ),
-            )
-        patches = self.patch.fwd(
-            patches=patches,
+            ),
             images=psi,
             positions=scan,
             patch_width=self.probe_shape,
-            nrepeat=probe.shape[-3],
         )
         patches = patches.reshape((
             *scan.shape[:-1],
-            probe.shape[-3],
-            self.detector_shape,
-            self.detector_shape,
+            1,
+            self.probe_shape,
+            self.probe_shape,
         ))
-        patches[..., self.pad:self.end, self.pad:self.end] *= probe
-        return patches
+        if self.detector_shape == self.probe_shape:
+            allocate = self.xp.empty_like
+        else:
+            allocate = self.xp.zeros_like
+        nearplane = allocate(
+            psi,
+            shape=(
+                *scan.shape[:-1],
+                probe.shape[-3],
+                self.detector_shape,
+                self.detector_shape,
+            ),
+        )
+        self.xp.multiply(
+            patches,
+            probe,
+            out=nearplane[..., self.pad:self.end, self.pad:self.end],
+        )
+        return nearplane
 
     def adj(self, nearplane, scan, probe, psi=None, overwrite=False):
         """Combine probe shaped patches into a psi shaped grid by addition."""
@@ -131,7 +138,7 @@ class Convolution(Operator):
         assert nearplane.shape[:-3] == scan.shape[:-1], (nearplane.shape,
                                                          scan.shape)
         assert psi.shape[:-2] == scan.shape[:-2], (psi.shape, scan.shape)
-        patches = self.xp.zeros_like(
+        patches = self.xp.empty_like(
             psi,
             shape=(
                 *scan.shape[:-2],
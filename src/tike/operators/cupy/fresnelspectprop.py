@@ -5,6 +5,7 @@ __copyright__ = "Copyright (c) 2024, UChicago Argonne, LLC."
 
 import typing
 
+import cupy.cuda.runtime
 import numpy.typing as npt
 import numpy as np
 
@@ -49,6 +50,34 @@ class FresnelSpectProp(CachedFFT, Operator):
         self.distance = distance
         self.wavelength = wavelength
 
+    def __enter__(self):
+        self.propagator_cache = {}
+        return super().__enter__()
+
+    def __exit__(self, type, value, traceback):
+        self.propagator_cache.clear()
+        del self.propagator_cache
+        super().__exit__(type, value, traceback)
+
+    def _get_fresnel_spectrum_propagator(
+        self,
+        N: typing.Tuple[int, int],
+        conjugate: bool = False,
+    ) -> np.ndarray:
+        """Cache the propagator (or its conjugate) for each shape and device."""
+        key = (*N, conjugate, cupy.cuda.runtime.getDevice())
+        if key not in self.propagator_cache:
+            propagator = self._create_fresnel_spectrum_propagator(
+                N,
+                self.probe_FOV,
+                self.distance,
+                self.wavelength,
+            )
+            if conjugate:
+                propagator = self.xp.conj(propagator)
+            self.propagator_cache[key] = propagator
+        return self.propagator_cache[key]
+
     def fwd(
         self,
         nearplane: npt.NDArray[np.csingle],
@@ -56,11 +85,8 @@ class FresnelSpectProp(CachedFFT, Operator):
         **kwargs,
     ) -> npt.NDArray[np.csingle]:
         """forward (parallel to beam direction) Fresnel spectrum propagtion operator"""
-        propagator = self._create_fresnel_spectrum_propagator(
+        propagator = self._get_fresnel_spectrum_propagator(
             (nearplane.shape[-2], nearplane.shape[-1]),
-            self.probe_FOV,
-            self.distance,
-            self.wavelength,
         )
 
         nearplane_fft2 = self._fft2(
@@ -86,11 +112,9 @@ class FresnelSpectProp(CachedFFT, Operator):
         **kwargs,
     ) -> npt.NDArray[np.csingle]:
         """backward (anti-parallel to beam direction) Fresnel spectrum propagtion operator"""
-        propagator = self._create_fresnel_spectrum_propagator(
+        propagator = self._get_fresnel_spectrum_propagator(
             (farplane.shape[-2], farplane.shape[-1]),
-            self.probe_FOV,
-            self.distance,
-            self.wavelength,
+            conjugate=True,
         )
 
         farplane_fft2 = self._fft2(
@@ -101,8 +125,7 @@ class FresnelSpectProp(CachedFFT, Operator):
         )
 
         nearplane = self._ifft2(
-            # FIXME: IS IT OK TO ALWAYS TAKE CONJ? OR SHOULD WE DO THIS ONCE AND REUSE?
-            farplane_fft2 * self.xp.conj(propagator),
+            farplane_fft2 * propagator,
             norm=self.norm,
             axes=(-2, -1),
             overwrite_x=overwrite,
@@ -122,7 +122,8 @@ class Multislice(Operator):
 
         # return exitwave
 
-        multislice_probes =  self.xp.zeros( ( psi.shape[0], scan.shape[-2], *probe.shape[-3:] ), dtype=probe.dtype )
+        # Every slice is assigned below, so the buffer is not zeroed first
+        multislice_probes =  self.xp.empty( ( psi.shape[0], scan.shape[-2], *probe.shape[-3:] ), dtype=probe.dtype )
         multislice_probes[ 0, ... ] = probe[..., 0, :, :, :]
 
         for tt in range(0, len(psi)) :
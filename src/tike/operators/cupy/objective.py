@@ -2,6 +2,33 @@
 
 import cupy as cp
 
+
+@cp.fuse()
+def _intensity_fuse(farplane):
+    return cp.sum(
+        cp.square(cp.real(farplane)) + cp.square(cp.imag(farplane)),
+        axis=1,
+    )
+
+
+def intensity_from_farplane(farplane) -> cp.ndarray:
+    """Return the intensity of the farplane wavefronts.
+
+    Parameters
+    ----------
+    farplane : (N, ..., M, M)
+        The farplane wavefronts
+
+    Returns
+    -------
+    intensity : (N, M, M)
+        The incoherent sum of the farplane over all modes.
+    """
+    # Merge all of the incoherent axes so the reduction is over one axis
+    return _intensity_fuse(
+        farplane.reshape(farplane.shape[0], -1, *farplane.shape[-2:]))
+
+
 # NOTE: We use mean instead of sum so that cost functions may be compared
 # when mini-batches of different sizes are used.
 
@@ -28,6 +55,11 @@ def gaussian(data, intensity) -> float:
     return cp.mean(_gaussian_fuse(data, intensity))
 
 
+@cp.fuse()
+def _gaussian_grad_fuse(farplane, data, intensity):
+    return farplane * (1 - cp.sqrt(data) / (cp.sqrt(intensity) + 1e-9))
+
+
 def gaussian_grad(data, farplane, intensity) -> cp.ndarray:
     """The gradient of the Gaussian model objective function
 
@@ -39,9 +71,11 @@ def gaussian_grad(data, farplane, intensity) -> cp.ndarray:
         The modeled intensity
     farplane : (N, K, L, M, M)
     """
-    return farplane * (1 - cp.sqrt(data) /
-                       (cp.sqrt(intensity) + 1e-9))[..., cp.newaxis,
-                                                    cp.newaxis, :, :]
+    return _gaussian_grad_fuse(
+        farplane,
+        data[..., cp.newaxis, cp.newaxis, :, :],
+        intensity[..., cp.newaxis, cp.newaxis, :, :],
+    )
 
 
 def gaussian_each_pattern(data, intensity) -> cp.ndarray:
@@ -66,6 +100,49 @@ def gaussian_each_pattern(data, intensity) -> cp.ndarray:
     )
 
 
+@cp.fuse()
+def _gaussian_cost_and_scale_fuse(data, intensity, measured_pixels):
+    amplitude = cp.sqrt(data)
+    modeled_amplitude = cp.sqrt(intensity)
+    diff = modeled_amplitude - amplitude
+    scale = cp.where(
+        measured_pixels,
+        amplitude / (modeled_amplitude + 1e-9) - 1,
+        1,
+    )
+    return diff * diff, scale
+
+
+def gaussian_cost_and_scale(data, intensity, measured_pixels):
+    """The Gaussian model objective and farplane scaling per pattern.
+
+    Multiplying the farplane by the scaling is the same as replacing the
+    measured pixels with the negative Gaussian gradient.
+
+    Parameters
+    ----------
+    data : (N, M, M)
+        The measured diffraction data
+    intensity : (N, M, M)
+        The modeled intensity
+    measured_pixels : (M, M) bool
+        The pixels where data was measured
+
+    Returns
+    -------
+    costs : (N, )
+        The objective function for each pattern over the measured pixels.
+    scale : (N, M, M)
+        The farplane scaling for each pattern.
+    """
+    cost, scale = _gaussian_cost_and_scale_fuse(
+        data,
+        intensity,
+        measured_pixels,
+    )
+    return cp.mean(cost[:, measured_pixels], axis=-1), scale
+
+
 # Poisson Model
 
 
@@ -87,6 +164,11 @@ def poisson(data, intensity) -> float:
     return cp.mean(_poisson_fuse(data, intensity))
 
 
+@cp.fuse()
+def _poisson_grad_fuse(farplane, data, intensity):
+    return farplane * (1 - data / (intensity + 1e-9))
+
+
 def poisson_grad(data, farplane, intensity) -> cp.ndarray:
     """The gradient of the Poisson model objective function.
 
@@ -98,8 +180,11 @@ def poisson_grad(data, farplane, intensity) -> cp.ndarray:
         The modeled intensity
     farplane : (N, K, L, M, M)
     """
-    return farplane * (1 - data /
-                       (intensity + 1e-9))[..., cp.newaxis, cp.newaxis, :, :]
+    return _poisson_grad_fuse(
+        farplane,
+        data[..., cp.newaxis, cp.newaxis, :, :],
+        intensity[..., cp.newaxis, cp.newaxis, :, :],
+    )
 
 
 def poisson_each_pattern(data, intensity) -> cp.ndarray:
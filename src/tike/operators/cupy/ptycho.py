@@ -15,14 +15,6 @@ from .multislice import Multislice, SingleSlice
 from . import objective
 
 
-@cp.fuse()
-def _intensity_from_farplane(farplane):
-    return cp.sum(
-        cp.real(farplane * cp.conj(farplane)),
-        axis=tuple(range(1, farplane.ndim - 2)),
-    )
-
-
 class Ptycho(Operator):
     """A Ptychography operator.
 
@@ -188,7 +180,7 @@ class Ptycho(Operator):
             scan=scan,
             probe=probe,
         )
-        return _intensity_from_farplane(farplane), farplane
+        return objective.intensity_from_farplane(farplane), farplane
 
     def cost(
         self,
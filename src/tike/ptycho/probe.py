@@ -513,21 +513,23 @@ def add_modes_random_phase(probe, nmodes):
     Brocklesby, "Ptychographic coherent diffractive imaging with orthogonal
     probe relaxation." Opt. Express 24, 8360 (2016). doi: 10.1364/OE.24.008360
     """
-    all_modes = np.empty_like(
+    xp = cp.get_array_module(probe)
+    all_modes = xp.empty_like(
         probe,
         shape=(*probe.shape[:-3], nmodes, *probe.shape[-2:]),
     )
-    pw = probe.shape[-1]
-    for m in range(nmodes):
-        if m < probe.shape[-3]:
-            # copy existing mode
-            all_modes[..., m, :, :] = probe[..., m, :, :]
-        else:
-            # randomly shift the first mode
-            shift = np.exp(-2j * np.pi * (np.random.rand(2, 1) - 0.5) *
-                           ((np.arange(0, pw) + 0.5) / pw - 0.5))
-            all_modes[..., m, :, :] = (probe[..., 0, :, :] * shift[0][None] *
-                                       shift[1][:, None])
+    # copy existing modes
+    ncopy = min(nmodes, probe.shape[-3])
+    all_modes[..., :ncopy, :, :] = probe[..., :ncopy, :, :]
+    if nmodes > ncopy:
+        # randomly shift the first mode; all new modes at once
+        pw = probe.shape[-1]
+        shift = xp.asarray(
+            np.exp(-2j * np.pi * (np.random.rand(nmodes - ncopy, 2, 1) - 0.5) *
+                   ((np.arange(0, pw) + 0.5) / pw - 0.5)))
+        all_modes[..., ncopy:, :, :] = (probe[..., 0:1, :, :] *
+                                        shift[:, 0, None, :] *
+                                        shift[:, 1, :, None])
     return all_modes
 
 
@@ -745,29 +747,31 @@ def orthogonalize_eig(
     Brocklesby, "Ptychographic coherent diffractive imaging with orthogonal
     probe relaxation." Opt. Express 24, 8360 (2016). doi: 10.1364/OE.24.008360
     """
+    if x.shape[-3] == 1:
+        # A single mode is already orthogonal
+        return x, power(x)
     xp = cp.get_array_module(x)
-    nmodes = x.shape[-3]
     # 'A' holds the dot product of all possible mode pairs. This is equivalent
-    # to x^H @ x. We only fill the upper half of `A` because it is
-    # conjugate-symmetric.
-    A = xp.empty_like(x, shape=(*x.shape[:-3], nmodes, nmodes))
-    for i in range(nmodes):
-        for j in range(i, nmodes):
-            A[..., i, j] = xp.sum(
-                x[..., i, :, :].conj() * x[..., j, :, :],
-                axis=(-1, -2),
-            )
+    # to x^H @ x. The modes are flattened so that `A` is assembled by a single
+    # batched matrix multiplication instead of one reduction per mode pair.
+    X = x.reshape(*x.shape[:-2], -1)
+    A = X.conj() @ X.swapaxes(-1, -2)
     # We find the eigen vectors of x^H @ x in order to get v^H from SVD of x
     # without computing u, s.
-    val, vectors = xp.linalg.eigh(A, UPLO='U')
-    result = (vectors.swapaxes(-1, -2) @ x.reshape(*x.shape[:-2], -1)).reshape(
-        *x.shape)
-    power = np.square(tike.linalg.norm(result, axis=(-2, -1),
-                                       keepdims=False)).flatten()
-    order = np.argsort(power, axis=None, kind='stable')[::-1]
-    result = result[..., order, :, :]
-    power = power[order]
-    return result, power
+    if xp is cp and A.shape[-1] <= 32:
+        # For a handful of modes, the launch overhead of the GPU eigen solver
+        # is much larger than the cost of copying A to the host and back.
+        _, vectors = np.linalg.eigh(cp.asnumpy(A), UPLO='U')
+        vectors = cp.asarray(vectors)
+    else:
+        _, vectors = xp.linalg.eigh(A, UPLO='U')
+    # eigh() returns eigenvalues in ascending order and each eigenvalue is the
+    # power of the corresponding new mode, so reversing the eigenvectors
+    # produces the modes already sorted from most to least powerful.
+    result = (vectors[..., ::-1].swapaxes(-1, -2) @ X).reshape(*x.shape)
+    mode_power = np.square(tike.linalg.norm(result, axis=(-2, -1),
+                                            keepdims=False)).flatten()
+    return result, mode_power
 
 
 def power(probe: npt.NDArray) -> npt.NDArray:
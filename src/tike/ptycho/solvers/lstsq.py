@@ -441,15 +441,19 @@ def _get_nearplane_gradients(
         farplane = op.fwd(probe=bunique_probe[blo:bhi],
                           scan=scan[lo:hi],
                           psi=psi)
-        intensity = cp.sum(
-            cp.square(cp.abs(farplane)),
-            axis=list(range(1, farplane.ndim - 2)),
-        )
-        bcosts[blo:bhi] = getattr(
-            tike.operators, f'{exitwave_options.noise_model}_each_pattern')(
-                data[:, measured_pixels][:, None, :],
-                intensity[:, measured_pixels][:, None, :],
+        intensity = tike.operators.intensity_from_farplane(farplane)
+        if exitwave_options.noise_model == 'gaussian':
+            bcosts[blo:bhi], farplane_scale = tike.operators.gaussian_cost_and_scale(
+                data,
+                intensity,
+                measured_pixels,
             )
+        else:
+            bcosts[blo:bhi] = getattr(
+                tike.operators, f'{exitwave_options.noise_model}_each_pattern')(
+                    data[:, measured_pixels][:, None, :],
+                    intensity[:, measured_pixels][:, None, :],
+                )
 
         if exitwave_options.noise_model == 'poisson':
 
@@ -490,12 +494,7 @@ def _get_nearplane_gradients(
 
         else:
 
-            farplane[..., measured_pixels] = -getattr(
-                tike.operators, f'{exitwave_options.noise_model}_grad')(
-                    data,
-                    farplane,
-                    intensity,
-                )[..., measured_pixels]
+            farplane *= farplane_scale[:, None, None, :, :]
 
         unmeasured_pixels = cp.logical_not(measured_pixels)
         farplane[..., unmeasured_pixels] *= (
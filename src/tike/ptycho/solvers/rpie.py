@@ -23,6 +23,19 @@ from .lstsq import _momentum_checked
 logger = logging.getLogger(__name__)
 
 
+@cp.fuse()
+def _psi_gradient(probe, diff, nmodes):
+    return cp.conj(probe) * diff / nmodes
+
+
+@cp.fuse()
+def _probe_gradient_sum(patches, diff):
+    return cp.sum(
+        cp.conj(patches) * diff,
+        axis=0,
+    )
+
+
 def rpie(
     parameters: PtychoParameters,
     data: npt.NDArray,
@@ -150,8 +163,8 @@ def rpie(
                 recover_probe,
                 algorithm_options,
             )
-            psi_update_numerator = None
-            probe_update_numerator = None
+            # Reuse the gradient buffers for the next batch
+            psi_update_numerator.fill(0)
 
     algorithm_options.costs.append([float(batch_cost.mean().get())])
 
@@ -341,12 +354,20 @@ def _get_nearplane_gradients(
 
     batch_size = len(batches[n])
 
+    # These variables are only as large as the batch
     bcosts = cp.empty(shape=batch_size, dtype=tike.precision.floating)
+    bpatches = cp.empty_like(
+        probe,
+        shape=(batch_size, *probe.shape[-2:]),
+    )
 
     psi_update_numerator = cp.zeros_like( psi ) if psi_update_numerator is None else psi_update_numerator
     
     #probe_update_numerator = cp.zeros_like( probe ) if probe_update_numerator is None else probe_update_numerator
-    probe_update_numerator = cp.zeros( ( psi.shape[0], *probe.shape ), dtype = probe.dtype )
+    if probe_update_numerator is None:
+        probe_update_numerator = cp.zeros( ( psi.shape[0], *probe.shape ), dtype = probe.dtype )
+    else:
+        probe_update_numerator.fill(0)
 
     position_update_numerator = cp.empty_like( scan ) if position_update_numerator is None else position_update_numerator
 
@@ -360,7 +381,7 @@ def _get_nearplane_gradients(
         (data,) = ind_args
         nonlocal bcosts, psi_update_numerator, probe_update_numerator
         nonlocal position_update_numerator, position_update_denominator
-        nonlocal eigen_weights, scan
+        nonlocal eigen_weights, scan, bpatches
 
         blo = lo - batch_start
         bhi = hi - batch_start
@@ -373,17 +394,23 @@ def _get_nearplane_gradients(
 
         farplane, multislice_probes = op.fwd_return_intermediate_probes(probe=unique_probe, scan=scan[lo:hi], psi=psi)
 
-        intensity = cp.sum(
-            cp.square(cp.abs(farplane)),
-            axis=list(range(1, farplane.ndim - 2)),
-        )
-        bcosts[blo:bhi] = getattr(
-            tike.operators,
-            f'{exitwave_options.noise_model}_each_pattern',
-        )(
-            data[:, measured_pixels][:, None, :],
-            intensity[:, measured_pixels][:, None, :],
-        )
+        intensity = tike.operators.intensity_from_farplane(farplane)
+        if exitwave_options.noise_model == 'gaussian':
+            # The cost and the gradient scaling are computed in one pass over
+            # data and intensity
+            bcosts[blo:bhi], farplane_scale = tike.operators.gaussian_cost_and_scale(
+                data,
+                intensity,
+                measured_pixels,
+            )
+        else:
+            bcosts[blo:bhi] = getattr(
+                tike.operators,
+                f'{exitwave_options.noise_model}_each_pattern',
+            )(
+                data[:, measured_pixels][:, None, :],
+                intensity[:, measured_pixels][:, None, :],
+            )
 
         if exitwave_options.noise_model == 'poisson':
 
@@ -427,12 +454,7 @@ def _get_nearplane_gradients(
             # Gaussian noise model for exitwave updates, steplength = 1
             # TODO: optimal step lengths using 2nd order taylor expansion
 
-            farplane[..., measured_pixels] = -getattr(
-                tike.operators, f'{exitwave_options.noise_model}_grad')(
-                    data,
-                    farplane,
-                    intensity,
-                )[..., measured_pixels]
+            farplane *= farplane_scale[:, None, None, :, :]
 
         unmeasured_pixels = cp.logical_not(measured_pixels)
         farplane[..., unmeasured_pixels] *= (
@@ -447,7 +469,11 @@ def _get_nearplane_gradients(
             #for tt in cp.arange( psi.shape[0] - 1, -1, -1 ) :
             for tt in range(len(psi) - 1, -1, -1 ) :        
 
-                grad_psi = (cp.conj(multislice_probes[ tt, :, None, ... ]) * diff / probe.shape[-3]).reshape( scan[lo:hi].shape[0] * probe.shape[-3], *probe.shape[-2:] )
+                grad_psi = _psi_gradient(
+                    multislice_probes[tt, :, None, ...],
+                    diff,
+                    probe.shape[-3],
+                ).reshape(scan[lo:hi].shape[0] * probe.shape[-3], *probe.shape[-2:])
 
                 psi_update_numerator[ tt, ... ] = op.diffraction.patch.adj(
                 patches=grad_psi,
@@ -457,15 +483,14 @@ def _get_nearplane_gradients(
                 )
 
                 patches = op.diffraction.patch.fwd(
-                        patches=cp.zeros_like(diff[..., 0, 0, :, :]),
+                        patches=bpatches[blo:bhi],
                         images=psi[ tt, ... ],
                         positions=scan[lo:hi],
                     )[..., None, None, :, :]
 
-                probe_update_numerator[ tt, ... ] += cp.sum(
-                        cp.conj(patches) * diff,
-                        axis=-5,
-                        keepdims=True,
+                probe_update_numerator[ tt, ... ] += _probe_gradient_sum(
+                        patches,
+                        diff,
                     )
 
                 if tt == 0:
@@ -474,10 +499,11 @@ def _get_nearplane_gradients(
                 diff = op.diffraction.propagation.adj( diff )      
 
 
-        if position_options or probe_options:
+        # The slice loop above ends on psi[0], so its patches are reused.
+        if (position_options or probe_options) and not object_options:
 
             patches = op.diffraction.patch.fwd(
-                patches=cp.zeros_like(diff[..., 0, 0, :, :]),
+                patches=bpatches[blo:bhi],
                 images=psi[0],
                 positions=scan[lo:hi],
             )[..., None, None, :, :]
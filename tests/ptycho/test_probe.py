@@ -158,6 +158,17 @@ def test_orthogonalize_eig():
     np.testing.assert_allclose(np.abs(final1), np.abs(final0), rtol=1e-4)
 
 
+def test_orthogonalize_eig_one_mode():
+    """A single mode is returned unchanged with its power."""
+    x = cp.asarray(
+        np.random.rand(1, 1, 1, 7, 7) + 1j * np.random.rand(1, 1, 1, 7, 7),
+        dtype=cp.complex64,
+    )
+    y, power = tike.ptycho.probe.orthogonalize_eig(x)
+    cp.testing.assert_array_equal(y, x)
+    cp.testing.assert_array_equal(power, tike.ptycho.probe.power(x))
+
+
 def test_hermite_modes():
     """Test the hermite basis probe generation is correct."""
     thisdir = os.path.dirname(__file__)
@@ -61,6 +61,11 @@ class Orthogonal(unittest.TestCase):
         y = tike.linalg.orthogonalize_gs(self.x, axis=(1, -1))
         assert self.x.shape == y.shape
 
+    def test_gram_schmidt_one_vector(self):
+        x = self.x[:, :1]
+        y = tike.linalg.orthogonalize_gs(x, axis=(-2, -1))
+        cp.testing.assert_array_equal(x, y)
+
     def test_gram_schmidt_orthogonal(self, axis=(-2, -1)):
         u = tike.linalg.orthogonalize_gs(self.x, axis=axis)
         for i in range(4):